@@ -138,6 +138,15 @@ def main():
         enable_forwarded_for=enable_forwarded_for
     )
 
+    try:
+        run(manager, args)
+    finally:
+        # キャッシュ定期削除スレッドとHTTPセッションを停止
+        manager.close()
+
+
+def run(manager, args):
+    """解析済みの引数に従って各処理を実行"""
     # 統計表示
     if args.stats:
         show_stats(manager)
@@ -3,8 +3,8 @@
 """
 
 import json
+import os
 import time
-from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 
@@ -88,6 +88,7 @@ class CookieManager:
         self._cookies_cache = None
         self._cache_timestamp = None
         self._file_mtime = None
+        self._file_signature = None  # (st_mtime_ns, st_size, st_ino)
         self.cache_duration = cache_duration  # デフォルト60秒（全サービス高頻度更新）
         
         # 全サービス対応の統一設定
@@ -97,13 +98,15 @@ class CookieManager:
     def load_cookies(self) -> Dict[str, str]:
         """クッキーファイルを読み込み、動的更新対応のTwitterドメインクッキー抽出"""
         current_time = time.time()
-        cookie_path = Path(self.cookies_file)
         
-        # ファイル存在チェック
-        if not cookie_path.exists():
-            raise FileNotFoundError(f"Cookieファイルが見つかりません: {self.cookies_file}")
-        
-        current_mtime = cookie_path.stat().st_mtime
+        # ファイル存在チェックと更新時刻の取得（キャッシュヒット時もstat 1回のみで済ませる）
+        try:
+            st = os.stat(self.cookies_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cookieファイルが見つかりません: {self.cookies_file}") from None
+        current_mtime = st.st_mtime
+        # TwitterAPI._cookie_file_signatureと同じく、同一秒内の書き換えや置き換え（inode変化）も検出する
+        current_signature = (st.st_mtime_ns, st.st_size, st.st_ino)
         
         # 全サービス統一の高頻度更新判定
         effective_duration = min(self.cache_duration, self._min_cache_duration)
@@ -112,11 +115,11 @@ class CookieManager:
         cache_valid = (
             self._cookies_cache is not None and
             self._cache_timestamp is not None and
-            self._file_mtime is not None and
+            self._file_signature is not None and
             # 1. 統一時間ベース有効期限チェック
             (current_time - self._cache_timestamp < effective_duration) and
             # 2. ファイル更新チェック  
-            (current_mtime == self._file_mtime)
+            (current_signature == self._file_signature)
         )
         
         if cache_valid:
@@ -127,7 +130,7 @@ class CookieManager:
         if self._cookies_cache is not None:
             print(f"   時間経過={current_time - (self._cache_timestamp or 0):.1f}秒 "
                   f"(設定: {effective_duration}秒), "
-                  f"ファイル更新={'Yes' if current_mtime != (self._file_mtime or 0) else 'No'}")
+                  f"ファイル更新={'Yes' if current_signature != self._file_signature else 'No'}")
         
         with open(self.cookies_file, "r", encoding="utf-8") as f:
             cookies_list = json.load(f)
@@ -142,6 +145,7 @@ class CookieManager:
         self._cookies_cache = cookies_dict
         self._cache_timestamp = current_time
         self._file_mtime = current_mtime
+        self._file_signature = current_signature
         
         print(f"✅ Cookie更新完了: {len(cookies_dict)}個のTwitter関連Cookie取得")
         return cookies_dict
@@ -152,6 +156,7 @@ class CookieManager:
         self._cookies_cache = None
         self._cache_timestamp = None
         self._file_mtime = None
+        self._file_signature = None
     
     def force_refresh_on_error_threshold(self, error_count: int, threshold: int = 20, reset_callback=None) -> bool:
         """403エラーが閾値を超えた場合の強制Cookie更新（無限ループ防止強化版）"""
@@ -69,6 +69,10 @@ class BulkBlockManager:
                 print(f"⚠️ ユーザーステータス監視システム初期化失敗: {e}")
             self.status_monitor = None
 
+    def close(self) -> None:
+        """APIクライアントのバックグラウンド処理とHTTPセッションを停止"""
+        self.api.close()
+
     def load_target_users(self) -> List[str]:
         """ブロック対象ユーザーリストを読み込み"""
         users, _ = self.config_manager.load_users_data()
@@ -716,7 +720,10 @@ class BulkBlockManager:
         print(f"  → ブロック実行: {user_info['name']} (ID: {user_info['id']})")
         block_result = self.api.block_user(user_info["id"], screen_name)
 
-        if block_result.get("success", False):
+        if block_result.get("cached", False):
+            # 関係情報キャッシュでブロック済みと判明しPOSTしなかった場合は新規ブロックとして数えない
+            self._check_already_blocking({**user_info, "blocking": True}, screen_name, stats)
+        elif block_result.get("success", False):
             print("  ✓ ブロック成功")
             stats["blocked"] += 1
             self.database.record_block_result(